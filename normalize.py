@@ -3,14 +3,265 @@ import re
 import yaml
 import string
 import fnmatch
+import itertools
+import functools
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# re's parser is private and may change or move in any release, so everything
+# built on it falls back to not optimising when it's missing or unexpected
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    try:
+        import sre_parse  # Python < 3.11
+    except ImportError:
+        sre_parse = None
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings give the .str methods vectorised kernels
+    CSV_DTYPE = 'string[pyarrow]'
+except ImportError:
+    CSV_DTYPE = str
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# regex_contains only needs to know whether a value matches, so the capture
+# groups pandas warns about in user patterns don't matter
+warnings.filterwarnings(
+    'ignore', message='This pattern is interpreted as a regular expression, and has match groups',
+    category=UserWarning, module=__name__,
+)
+
+# Matches numbered or named backreferences inside a regex pattern
+BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Matches patterns made up only of characters with no special regex meaning
+LITERAL = re.compile(r'[^.^$*+?()\[\]{}|\\]+')
+
+# Matches any single punctuation character
+PUNCTUATION = re.compile(f'[{re.escape(string.punctuation)}]')
+
+# RE2 is opt-in: it guarantees linear-time matching, but reads some syntax
+# differently from re (see README) and is slower here, as pandas can only
+# vectorise re patterns
+USE_RE2 = os.environ.get('NORMALIZE_USE_RE2') == '1'
+
+# Fused regex runs with at least this many patterns are prefiltered by Hyperscan
+HYPERSCAN_MIN_PATTERNS = 50
+
+# Per-thread Hyperscan scratch space, see hyperscan_scratch
+HYPERSCAN_SCRATCH = threading.local()
+
+# Anchors that mean the same in re and Hyperscan, in Hyperscan's syntax
+HYPERSCAN_ANCHORS = {
+    sre_parse.AT_BEGINNING: '^',
+    sre_parse.AT_BEGINNING_STRING: '\\A',
+    sre_parse.AT_END: '$',
+    sre_parse.AT_END_STRING: '\\z',
+} if sre_parse is not None else {}
+
+@functools.lru_cache(maxsize=4096)
+def compile_pattern(pattern, flags=re.IGNORECASE):
+    # Compile each pattern once per process, however many times it's used.
+    # With RE2 enabled, patterns it rejects (backreferences, lookarounds)
+    # fall back to the backtracking re module.
+    if USE_RE2 and re2 is not None and not flags & ~re.IGNORECASE:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+def regex_replace(column_data, compiled_pattern, repl):
+    if isinstance(compiled_pattern, re.Pattern):
+        return column_data.str.replace(compiled_pattern, repl, regex=True)
+    # pandas only accepts re patterns, so other engines are run value by value
+    return column_data.map(lambda value: compiled_pattern.sub(repl, value), na_action='ignore')
+
+def regex_contains(column_data, compiled_pattern):
+    if isinstance(compiled_pattern, re.Pattern) and column_data.dtype == object:
+        return column_data.str.contains(compiled_pattern, na=False)
+    # pandas only accepts re patterns, and on Arrow string columns it hands
+    # them to pyarrow's RE2 kernel, which reads some syntax differently from
+    # re. Everything else is therefore searched value by value.
+    matches = column_data.map(lambda value: compiled_pattern.search(value) is not None, na_action='ignore')
+    return matches.fillna(False).astype(bool)
+
+def hyperscan_expression(pattern):
+    # Rebuild the pattern from re's own parse tree, so Hyperscan gets the
+    # meaning re gives it rather than re-reading the text as PCRE (where e.g.
+    # {,2} is a literal). None means it uses something that isn't known to
+    # behave the same in both engines.
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+        if parsed.state.flags & ~(re.IGNORECASE | re.UNICODE | re.VERBOSE):
+            return None
+        return hyperscan_sequence(parsed)
+    except Exception:
+        return None
 
-def read_csv(file_name):
-    # Set the max_colwidth option to prevent text wrapping
-    pd.set_option('display.max_colwidth', None)
+def hyperscan_sequence(items):
+    return ''.join(hyperscan_item(op, av) for op, av in items)
+
+def hyperscan_item(op, av):
+    if op is sre_parse.LITERAL:
+        return hyperscan_char(av)
+    if op is sre_parse.NOT_LITERAL:
+        return f'[^{hyperscan_char(av)}]'
+    if op is sre_parse.ANY:
+        return '.'
+    if op is sre_parse.IN and av == [(sre_parse.CATEGORY, sre_parse.CATEGORY_NOT_SPACE)]:
+        return f"[^{''.join(map(hyperscan_char, whitespace_codes()))}]"
+    if op is sre_parse.IN:
+        return f"[{''.join(hyperscan_class_item(item_op, item_av) for item_op, item_av in av)}]"
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        # Greediness doesn't change whether a value matches at all
+        low, high, items = av
+        high = '' if high == sre_parse.MAXREPEAT else high
+        return f'(?:{hyperscan_sequence(items)}){{{low},{high}}}'
+    if op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, items = av
+        # Caseless matching everywhere only ever finds more, never fewer
+        if (add_flags | del_flags) & ~re.IGNORECASE:
+            raise ValueError(f"Unsupported inline flags: {add_flags}, {del_flags}")
+        return f'(?:{hyperscan_sequence(items)})'
+    if op is sre_parse.BRANCH:
+        return f"(?:{'|'.join(hyperscan_sequence(items) for items in av[1])})"
+    if op is sre_parse.AT and av in HYPERSCAN_ANCHORS:
+        return HYPERSCAN_ANCHORS[av]
+    raise ValueError(f"Unsupported regex construct: {op}")
+
+def hyperscan_class_item(op, av):
+    if op is sre_parse.NEGATE:
+        return '^'
+    if op is sre_parse.LITERAL:
+        return hyperscan_char(av)
+    if op is sre_parse.RANGE:
+        return f'{hyperscan_char(av[0])}-{hyperscan_char(av[1])}'
+    # \w covers different characters in the two engines, \d doesn't, and
+    # \s is spelled out as exactly the characters re counts as whitespace
+    if op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_SPACE:
+        return ''.join(map(hyperscan_char, whitespace_codes()))
+    if op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_DIGIT:
+        return '\\d'
+    if op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_NOT_DIGIT:
+        return '\\D'
+    raise ValueError(f"Unsupported character class item: {op}")
+
+@functools.lru_cache(maxsize=None)
+def whitespace_codes():
+    # re's \s on str patterns matches exactly the characters str.isspace() does
+    return tuple(code for code in range(0x110000) if chr(code).isspace())
+
+def hyperscan_char(code):
+    return f'\\x{{{code:x}}}'
+
+@functools.lru_cache(maxsize=256)
+def compile_hyperscan_database(finds):
+    # Compile each run of patterns once per process, like compile_pattern
+    expressions = [hyperscan_expression(find) for find in finds]
+    if None in expressions:
+        return None
+
+    database = hyperscan.Database()
+    flags = (
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+    )
+    try:
+        database.compile(
+            expressions=[expression.encode() for expression in expressions],
+            ids=list(range(len(finds))),
+            flags=[flags] * len(finds),
+        )
+    except hyperscan.error:
+        # Patterns Hyperscan can't compile skip the prefilter
+        return None
+    return database
+
+def hyperscan_scratch(database):
+    # A database is shared between threads, but its scratch space can only be
+    # used by one scan at a time, so each thread keeps its own
+    scratches = HYPERSCAN_SCRATCH.__dict__.setdefault('scratches', {})
+    database_scratch = scratches.get(id(database))
+    if database_scratch is None or database_scratch[0] is not database:
+        database_scratch = scratches[id(database)] = (database, hyperscan.Scratch(database))
+    return database_scratch[1]
+
+def hyperscan_matches(column_data, finds):
+    # Hyperscan scans for every pattern in one pass but can't report capture
+    # groups, so it only picks out the values the regex engine needs to see
+    database = compile_hyperscan_database(tuple(finds))
+    if database is None:
+        return None
+    scratch = hyperscan_scratch(database)
+
+    def on_match(pattern_id, start, end, flags, matched):
+        matched.append(pattern_id)
+
+    def has_match(value):
+        matched = []
+        database.scan(value.encode(), match_event_handler=on_match, context=matched, scratch=scratch)
+        return bool(matched)
+
+    return column_data.map(has_match, na_action='ignore').fillna(False).astype(bool)
+
+def required_literal(pattern):
+    # Longest run of literal characters every match of the pattern contains,
+    # taken from the top-level sequence only, or '' if there isn't one
+    runs = ['']
+    def walk(items):
+        for op, av in items:
+            if op is sre_parse.LITERAL:
+                runs[-1] += chr(av)
+            elif op is sre_parse.SUBPATTERN:
+                walk(av[-1])
+            else:
+                runs.append('')
+
+    try:
+        walk(sre_parse.parse(pattern))
+    except Exception:
+        # An invalid pattern, or a parse tree this walk doesn't recognise,
+        # just means a full scan
+        return ''
+    return max(runs, key=len)
+
+def apply_prefiltered(column_data, finds, apply_function):
+    # Values that contain none of the patterns' required literals can't match,
+    # so only the rest go through the regex pipeline. Purely literal patterns
+    # gain nothing from a prefilter scan.
+    literals = [required_literal(find) for find in finds]
+    if not all(literals) or all(LITERAL.fullmatch(find) for find in finds):
+        return apply_function(column_data)
+
+    prefilter = compile_pattern("|".join(re.escape(literal) for literal in literals))
+    candidates = regex_contains(column_data, prefilter)
+    if candidates.all():
+        return apply_function(column_data)
+    return column_data.mask(candidates, apply_function(column_data[candidates]))
 
+def read_csv(file_name):
     try:
-        # Read the CSV file into a DataFrame
-        df = pd.read_csv(file_name, na_values=[''])
+        # Read every column's raw text as strings, with empty cells kept as
+        # empty strings. The C parser never infers a type first, so values
+        # like 0123 or -3.90 come through exactly as written.
+        df = pd.read_csv(file_name, dtype=CSV_DTYPE, keep_default_na=False)
     except FileNotFoundError:
         print(f"File {file_name} not found.")
         return None
@@ -18,12 +269,6 @@ def read_csv(file_name):
         print(f"Error reading file {file_name}.")
         return None
 
-    # Replace missing values in all columns with empty strings
-    df = df.fillna('')
-
-    # Convert DataFrame columns to strings
-    df = df.astype(str)
-
     # Check if DataFrame is empty
     if df.empty:
         print(f"File {file_name} is empty or doesn't contain valid data.")
@@ -65,7 +310,6 @@ def read_yaml_file(filename):
 
 def validate_patterns(patterns):
     validation_errors = []
-    compiled_patterns = {}
 
     for i, pattern in enumerate(patterns):
         if 'column' not in pattern or 'patterns' not in pattern:
@@ -76,7 +320,7 @@ def validate_patterns(patterns):
             if not is_valid_column_pattern(column_pattern):
                 validation_errors.append(f"Pattern {i+1}: Each column pattern must have 'find', 'replace', and 'type' fields.")
 
-            if not compile_regex_patterns(column_pattern.get('find', []), compiled_patterns, i, pattern):
+            if not compile_regex_patterns(column_pattern, i, pattern):
                 validation_errors.append(f"Pattern {i+1}, Column '{pattern['column']}': Invalid regular expression.")
 
     return validation_errors
@@ -86,19 +330,19 @@ def is_valid_column_pattern(column_pattern):
     return all(field in column_pattern for field in ['find', 'replace', 'type'])
 
 
-def compile_regex_patterns(find_patterns, compiled_patterns, pattern_index, pattern):
-    for find_pattern in find_patterns:
-        pattern_type = pattern.get('type')
-        if pattern_type == 'regex' and find_pattern not in compiled_patterns:
-            try:
-                compiled_pattern = re.compile(find_pattern)
-                compiled_patterns[find_pattern] = compiled_pattern
-            except re.error as e:
-                print(f"Error compiling pattern: {find_pattern}")
-                print(f"Pattern: {pattern}")
-                print(f"Pattern Index: {pattern_index}")
-                print(f"Error: {e}")
-                return False
+def compile_regex_patterns(column_pattern, pattern_index, pattern):
+    # Compiled patterns are cached, so the apply functions reuse these
+    if column_pattern.get('type') != 'regex':
+        return True
+    for find_pattern in column_pattern.get('find', []):
+        try:
+            compile_pattern(find_pattern)
+        except re.error as e:
+            print(f"Error compiling pattern: {find_pattern}")
+            print(f"Pattern: {pattern}")
+            print(f"Pattern Index: {pattern_index}")
+            print(f"Error: {e}")
+            return False
     return True
 
 def apply_substitution_pattern(column_data, find, replace):
@@ -106,26 +350,71 @@ def apply_substitution_pattern(column_data, find, replace):
     if not isinstance(find, list):
         find = [find]
     if not isinstance(replace, list):
-        replace = [replace]
-    column_data = column_data.astype(str)  # Convert column to string type
-    
-    for find_pattern, replace_pattern in zip(find, replace):
-        column_data = column_data.replace(find_pattern, replace_pattern)
-
-    return column_data
+        # A single replacement applies to every find value
+        replace = [replace] * len(find)
+
+    # Look up every (whitespace-stripped) value against all find values at once
+    substitutions = dict(zip(find, replace))
+    stripped = column_data.str.strip()
+    matches = stripped.isin(list(substitutions))
+    # Built as object so non-string replacements (e.g. 2017) aren't upcast to
+    # float by the NaN a map() would leave for unmatched values
+    replacements = pd.Series(
+        [substitutions.get(value) for value in stripped], index=column_data.index, dtype=object
+    )
+    return column_data.mask(matches, replacements)
+
+def merge_substitution_patterns(substitution_patterns):
+    # Merge consecutive substitution patterns into a single lookup. A value
+    # replaced by an earlier pattern is followed through the later ones.
+    substitutions = {}
+    for substitution_pattern in substitution_patterns:
+        find = substitution_pattern['find']
+        replace = substitution_pattern['replace']
+        if not isinstance(find, list):
+            find = [find]
+        if not isinstance(replace, list):
+            replace = [replace] * len(find)
+
+        for find_value, replace_value in zip(find, replace):
+            for key, value in substitutions.items():
+                if isinstance(value, str) and value.strip() == find_value:
+                    substitutions[key] = replace_value
+            substitutions.setdefault(find_value, replace_value)
+
+    return list(substitutions), list(substitutions.values())
 
 def apply_wildcard_pattern(column_data, find, replace):
     # Validate and sanitize the find and replace values
     find = sanitize_input(find)
     replace = sanitize_input(replace)
 
-    # Apply the wildcard pattern using a lambda function
-    return column_data.apply(
-        lambda x: replace
-        if any(re.search(f.replace('*', '.*'), x, flags=re.IGNORECASE) for f in find)
-        else x
+    if not find:
+        return column_data
+
+    # Combine every wildcard term into one alternation, tested once per value
+    wildcard_patterns = [wildcard_to_regex(f) for f in find]
+    wildcard_pattern = compile_pattern("|".join(f"(?:{pattern})" for pattern in wildcard_patterns))
+    return apply_prefiltered(
+        column_data,
+        wildcard_patterns,
+        lambda values: values.mask(regex_contains(values, wildcard_pattern), replace),
     )
 
+def wildcard_to_regex(wildcard):
+    # search() already matches anywhere in the value, so a leading or trailing
+    # .* only adds backtracking and can be dropped
+    pattern = wildcard.replace('*', '.*')
+    while pattern.startswith('.*') and pattern[2:3] not in ('*', '+', '?', '{'):
+        pattern = pattern[2:]
+    while pattern.endswith('.*'):
+        # Keep an escaped dot, which is a literal rather than a wildcard
+        backslashes = len(pattern[:-2]) - len(pattern[:-2].rstrip('\\'))
+        if backslashes % 2:
+            break
+        pattern = pattern[:-2]
+    return pattern
+
 def sanitize_input(input_value):
     if isinstance(input_value, list):
         # Handle lists of values
@@ -137,33 +426,86 @@ def sanitize_input(input_value):
 def sanitize_input_orig(input_value):
     if isinstance(input_value, list):
         # Handle lists of values
-        return [re.sub(f'[{re.escape(string.punctuation)}]', '', value) for value in input_value]
+        return [PUNCTUATION.sub('', value) for value in input_value]
     
     # Handle individual values
-    return re.sub(f'[{re.escape(string.punctuation)}]', '', input_value)
+    return PUNCTUATION.sub('', input_value)
+
+def build_replacement(template):
+    # Parse the replace template once rather than on every match
+    if not isinstance(template, str):
+        return lambda text: template.format(text=text)
+    parts = list(string.Formatter().parse(template))
+
+    # Anything beyond plain {text} fields keeps the full str.format behaviour
+    if any(field not in (None, 'text') or spec or conversion for _, field, spec, conversion in parts):
+        return lambda text: template.format(text=text)
+    if parts == [('', 'text', '', None)]:
+        return lambda text: text
+    return lambda text: "".join(literal + (text if field else "") for literal, field, _, _ in parts)
+
+def is_literal_pattern(pattern):
+    # Patterns without metacharacters or cased letters match exactly the same
+    # text with a plain, case-sensitive string replace
+    return bool(LITERAL.fullmatch(pattern)) and pattern.lower() == pattern.upper()
 
 def apply_regex_pattern(column_data, find, replace):
-    # Compile the regex pattern outside the loop
-    compiled_patterns = [re.compile(pattern, flags=re.IGNORECASE) for pattern in find]
+    build_replace = build_replacement(replace)
 
-    # Apply the regex pattern using a lambda function
-    for compiled_pattern in compiled_patterns:
+    def replace_match(match):
+        return build_replace(match.group(1) if match.group(1) else "")
+
+    # Apply each regex pattern across the whole column in one call
+    for pattern in find:
+        if is_literal_pattern(pattern):
+            column_data = column_data.str.replace(pattern, build_replace(""), regex=False)
+            continue
         try:
-            column_data = column_data.apply(
-                lambda x, pattern=compiled_pattern: re.sub(
-                    pattern,  # Regular expression pattern to search for
-                    lambda match: replace.format(
-                        text=match.group(1) if match.group(1) else ""
-                    ),
-                    str(x),  # Original value
-                )
-            )
+            column_data = regex_replace(column_data, compile_pattern(pattern), replace_match)
         except re.error:
-            print(f"Error in regular expression: {compiled_pattern.pattern}")
+            print(f"Error in regular expression: {pattern}")
             continue
     return column_data
 
-def replace_with_patterns(dataframe, patterns):
+def apply_fused_regex_patterns(column_data, finds, replaces):
+    def apply_in_order(values):
+        for find, replace in zip(finds, replaces):
+            values = apply_regex_pattern(values, [find], replace)
+        return values
+
+    # Backreferences are numbered per pattern, so they can't be fused safely,
+    # and all-literal patterns are faster as plain string replaces
+    if any(BACKREFERENCE.search(find) for find in finds) or all(map(is_literal_pattern, finds)):
+        return apply_in_order(column_data)
+
+    # A value none of the patterns match is left unchanged by all of them, so
+    # one fused scan picks out the values that need the patterns applied in
+    # order. Later patterns still see the output of earlier ones.
+    matches = None
+    if hyperscan is not None and len(finds) >= HYPERSCAN_MIN_PATTERNS:
+        matches = hyperscan_matches(column_data, finds)
+    if matches is None:
+        try:
+            fused_pattern = compile_pattern("|".join(f"(?:{find})" for find in finds))
+        except re.error:
+            # e.g. inline global flags or repeated group names across patterns
+            return apply_in_order(column_data)
+        matches = regex_contains(column_data, fused_pattern)
+
+    if matches.all():
+        return apply_in_order(column_data)
+    return column_data.mask(matches, apply_in_order(column_data[matches]))
+
+def transform_column(column_data, column_patterns):
+    # Repeated values only need transforming once, so when at least half the
+    # column is duplicates transform the unique values and map them back
+    unique_values = column_data.drop_duplicates()
+    if len(unique_values) < 0.5 * len(column_data):
+        transformed_values = apply_column_patterns(unique_values, column_patterns)
+        return column_data.map(pd.Series(transformed_values.values, index=unique_values.values))
+    return apply_column_patterns(column_data, column_patterns)
+
+def apply_column_patterns(column_data, column_patterns):
     # Mapping of pattern types to corresponding replace functions
     pattern_mapping = {
         'substitution': apply_substitution_pattern,
@@ -171,26 +513,64 @@ def replace_with_patterns(dataframe, patterns):
         'regex': apply_regex_pattern
     }
 
-    # Apply patterns to each column in the DataFrame
+    # Consecutive patterns of the same type are applied together
+    for pattern_type, replace_patterns in itertools.groupby(
+        column_patterns, key=lambda replace_pattern: replace_pattern.get('type')
+    ):
+        replace_patterns = list(replace_patterns)
+        if pattern_type == 'regex':
+            finds = [find for rp in replace_patterns for find in rp['find']]
+            replaces = [rp['replace'] for rp in replace_patterns for _ in rp['find']]
+            column_data = apply_prefiltered(
+                column_data, finds, lambda values: apply_fused_regex_patterns(values, finds, replaces)
+            )
+            continue
+
+        # Consecutive substitution patterns share one hash lookup per value
+        if pattern_type == 'substitution':
+            finds, replaces = merge_substitution_patterns(replace_patterns)
+            column_data = apply_substitution_pattern(column_data, finds, replaces)
+            continue
+
+        for replace_pattern in replace_patterns:
+            find = replace_pattern['find']
+            replace = replace_pattern['replace']
+
+            # Check if the pattern type is supported
+            if pattern_type in pattern_mapping:
+                # Retrieve the corresponding replace function
+                replace_function = pattern_mapping[pattern_type]
+
+                # Apply the replace function to the column
+                column_data = replace_function(column_data, find, replace)
+
+    return column_data
+
+def replace_with_patterns(dataframe, patterns):
+    # Group the column patterns so each column is only written back once
+    patterns_by_column = {}
     for pattern in patterns:
-        column = pattern['column']
-        column_patterns = pattern['patterns']
-        
-        # Check if the column exists in the DataFrame
-        if column in dataframe.columns:
-            for replace_pattern in column_patterns:
-                find = replace_pattern['find']
-                replace = replace_pattern['replace']
-                pattern_type = replace_pattern.get('type')
-
-                # Check if the pattern type is supported
-                if pattern_type in pattern_mapping:
-                    # Retrieve the corresponding replace function
-                    replace_function = pattern_mapping[pattern_type]
-
-                    # Apply the replace function to the column
-                    dataframe[column] = replace_function(dataframe[column], find, replace)
-    
+        patterns_by_column.setdefault(pattern['column'], []).extend(pattern['patterns'])
+
+    # Check if the column exists in the DataFrame
+    columns = [column for column in patterns_by_column if column in dataframe.columns]
+
+    # The apply functions work on strings, so convert any column that wasn't
+    # read as strings once here rather than in every function
+    for column in columns:
+        if not pd.api.types.is_string_dtype(dataframe[column]):
+            dataframe[column] = dataframe[column].astype(str)
+
+    # Columns are independent, so transform them concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        transformed_columns = {
+            column: executor.submit(transform_column, dataframe[column], patterns_by_column[column])
+            for column in columns
+        }
+
+    for column, transformed_column in transformed_columns.items():
+        dataframe[column] = transformed_column.result()
+
     return dataframe
 
 
@@ -205,7 +585,37 @@ def main(csv_file, pattern_file):
     df = replace_with_patterns(df, patterns)
     return df, patterns
 
+def main_streaming(csv_file, pattern_file, chunksize=65536):
+    patterns = read_patterns_file(pattern_file)
+    if not patterns:
+        return
+
+    try:
+        # Read the CSV file a chunk at a time so memory use stays constant
+        chunks = pd.read_csv(csv_file, chunksize=chunksize, dtype=CSV_DTYPE, keep_default_na=False)
+    except FileNotFoundError:
+        print(f"File {csv_file} not found.")
+        return
+    except pd.errors.ParserError:
+        print(f"Error reading file {csv_file}.")
+        return
+
+    # A parse error in a later chunk propagates, so callers never mistake a
+    # truncated output for a complete one
+    with chunks:
+        for chunk in chunks:
+            # Apply the patterns to each chunk as it's read
+            yield replace_with_patterns(chunk, patterns)
+
+def write_csv_streaming(chunks, file_name):
+    # Write the header with the first chunk and append the rest
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(file_name, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+
 if __name__ == "__main__":
+    # Set the max_colwidth option to prevent text wrapping
+    pd.set_option('display.max_colwidth', None)
+
     df, patterns = main('JointAccount-08Dec17a.csv', 'patterns.yml')
     if df is not None and patterns is not None:
         # Print the modified DataFrame
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from normalize import main, main_streaming, required_literal
+
+
+@pytest.mark.parametrize('pattern, literal', [
+    (r'(\d{4})CASH', 'CASH'),
+    (r'^(.*?)\s+\d{5}$', ''),
+    ('Hell Pizza.', 'Hell Pizza'),
+    ('ab(cd)e?f', 'abcd'),
+    (r'a\.b', 'a.b'),
+    ('abc|xyz', ''),
+    (r'\w{123}', ''),
+    ('(unclosed', ''),
+])
+def test_required_literal(pattern, literal):
+    assert required_literal(pattern) == literal
+
+
+def test_required_literal_unexpected_parse_tree(monkeypatch):
+    # A parse tree shape the walk doesn't recognise falls back to a full scan
+    monkeypatch.setattr('normalize.sre_parse.parse', lambda pattern: [('unexpected',)])
+    assert required_literal('abc') == ''
+
+
+def test_main_matches_with_re_on_string_columns(tmp_path):
+    # RE2 reads {,2} as a literal and \w and \b as ASCII-only, re doesn't
+    csv_file = tmp_path / 'data.csv'
+    csv_file.write_text('Code\naab\ncafé\n', encoding='utf-8')
+    pattern_file = tmp_path / 'patterns.yml'
+    pattern_file.write_text(
+        "- column: Code\n"
+        "  patterns:\n"
+        "  - find: ['(a{,2})b']\n"
+        "    replace: '<{text}>'\n"
+        "    type: regex\n"
+        "  - find: ['(caf\\w)\\b']\n"
+        "    replace: '[{text}]'\n"
+        "    type: regex\n"
+        "  - find: ['c*f']\n"
+        "    replace: 'wildcard'\n"
+        "    type: wildcard\n",
+        encoding='utf-8',
+    )
+
+    df, _ = main(str(csv_file), str(pattern_file))
+
+    assert df['Code'].tolist() == ['<aa>', 'wildcard']
+
+
+def test_substitution_keeps_integer_replacements(tmp_path):
+    csv_file = tmp_path / 'data.csv'
+    csv_file.write_text('Year\nseventeen\nother\n', encoding='utf-8')
+    pattern_file = tmp_path / 'patterns.yml'
+    pattern_file.write_text(
+        "- column: Year\n"
+        "  patterns:\n"
+        "  - find: [seventeen]\n"
+        "    replace: 2017\n"
+        "    type: substitution\n",
+        encoding='utf-8',
+    )
+
+    df, _ = main(str(csv_file), str(pattern_file))
+
+    assert df.to_csv(index=False).splitlines() == ['Year', '2017', 'other']
+
+
+def test_main_streaming_raises_on_a_bad_later_chunk(tmp_path):
+    csv_file = tmp_path / 'data.csv'
+    csv_file.write_text('a,b\n1,2\n3,4\n5,"6\n', encoding='utf-8')
+    pattern_file = tmp_path / 'patterns.yml'
+    pattern_file.write_text(
+        "- column: a\n"
+        "  patterns:\n"
+        "  - find: ['1']\n"
+        "    replace: one\n"
+        "    type: substitution\n",
+        encoding='utf-8',
+    )
+
+    chunks = main_streaming(str(csv_file), str(pattern_file), chunksize=1)
+
+    assert next(chunks)['a'].tolist() == ['one']
+    with pytest.raises(pd.errors.ParserError):
+        list(chunks)